@@ -8,6 +8,10 @@ from skeleton.states import GameState, TerminalState, RoundState, NUM_ROUNDS, BI
 from skeleton.bot import Bot
 from skeleton.runner import parse_args, run_bot
 
+# Card string -> rank 0..12 / suit 0..3
+CARD_RANK = {r + s: ri for ri, r in enumerate("23456789TJQKA") for s in "cdhs"}
+CARD_SUIT = {r + s: si for r in "23456789TJQKA" for si, s in enumerate("cdhs")}
+
 class Player(Bot):
     def __init__(self):
         self.consecutive_uncalled_shoves = 0
@@ -19,6 +23,22 @@ class Player(Bot):
     def handle_new_round(self, game_state, round_state, active):
         self.did_shove_this_round = False
 
+        # Calculate rounds remaining (including current one)
+        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
+
+        # Average cost to fold every hand is 1.5 chips/round.
+        # If we have more chips than we can possibly lose, stop betting.
+        # We add a small buffer (+2) to handle the variance of ending on a Big Blind.
+        self.secure_win_threshold = (rounds_remaining * 1.5) + 2
+
+        self.cache_hole_cards(round_state.hands[active])
+
+    def cache_hole_cards(self, cards):
+        '''Caches our hole-card ranks/suits for the round, rebuilt after we discard'''
+        self.my_ranks = tuple(CARD_RANK[c] for c in cards)
+        self.my_suits = tuple(CARD_SUIT[c] for c in cards)
+        self.cards_dirty = False
+
     def handle_round_over(self, game_state, terminal_state, active):
         # Update adaptive counters based on results
         my_delta = terminal_state.deltas[active]
@@ -44,30 +64,35 @@ class Player(Bot):
         # 1. HANDLE DISCARD ACTION
         # ---------------------------------------------------------
         if DiscardAction in legal:
+            # Hand changes after this, re-cache on our next decision
+            self.cards_dirty = True
             return self.get_discard_action(my_cards, board)
 
+        if self.cards_dirty:
+            self.cache_hole_cards(my_cards)
+
+        can_raise = RaiseAction in legal
+        can_call = CallAction in legal
+        can_check = CheckAction in legal
+
         # ---------------------------------------------------------
         # 2. LOCKDOWN CHECK (Safety Mode) - EXACT ORIGINAL LOGIC
         # ---------------------------------------------------------
-        # Calculate rounds remaining (including current one)
-        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
-        
-        # Average cost to fold every hand is 1.5 chips/round.
-        # If we have more chips than we can possibly lose, stop betting.
-        # We add a small buffer (+2) to handle the variance of ending on a Big Blind.
-        secure_win_threshold = (rounds_remaining * 1.5) + 2
-        
-        if game_state.bankroll > secure_win_threshold:
+        if game_state.bankroll > self.secure_win_threshold:
             # We have won. Do not risk any chips.
-            if CheckAction in legal:
+            if can_check:
                 return CheckAction()
             return FoldAction()
 
+        # One raise_bounds() call shared by the shove and min-raise paths
+        if can_raise:
+            min_raise, max_raise = round_state.raise_bounds()
+
         # ---------------------------------------------------------
         # 3. PRE-FLOP STRATEGY
         # ---------------------------------------------------------
         if street == 0:
-            is_strong = self.is_good_preflop(my_cards)
+            is_strong = self.is_good_preflop(self.my_ranks, self.my_suits)
             
             # --- BULLY MODE (Range Merging) ---
             if self.is_bully_mode:
@@ -79,10 +104,9 @@ class Player(Bot):
                     if is_strong:
                         # TRAP SPRUNG: We have a monster and they raised!
                         # JAM ALL-IN over their raise.
-                        if RaiseAction in legal:
-                            min_r, max_r = round_state.raise_bounds()
+                        if can_raise:
                             self.did_shove_this_round = True
-                            return RaiseAction(max_r)
+                            return RaiseAction(max_raise)
                         return CallAction()
                     else:
                         # We were stealing with trash. Fold.
@@ -91,28 +115,26 @@ class Player(Bot):
                 # CASE B: Unopened Pot (We act first or they limped)
                 # We Min-Raise with 100% of our range (Both Strong and Weak)
                 # This disguises our hand.
-                if RaiseAction in legal:
-                    min_raise, max_raise = round_state.raise_bounds()
+                if can_raise:
                     return RaiseAction(min_raise)
                     
                 # If we can't raise for some reason, check/call
-                if CheckAction in legal: return CheckAction()
+                if can_check: return CheckAction()
                 return CallAction()
 
             # --- STANDARD MODE (GTO-ish Shoving) ---
             # Against unknown opponents, we unbalance towards value-shoving
             if is_strong:
-                if RaiseAction in legal:
-                    min_r, max_r = round_state.raise_bounds()
+                if can_raise:
                     self.did_shove_this_round = True
-                    return RaiseAction(max_r)
-                if CallAction in legal: return CallAction()
-                if CheckAction in legal: return CheckAction()
+                    return RaiseAction(max_raise)
+                if can_call: return CallAction()
+                if can_check: return CheckAction()
             else:
                 # Standard play with weak hands: Check or Fold
-                if CheckAction in legal: return CheckAction()
+                if can_check: return CheckAction()
                 # Limp if cheap
-                if CallAction in legal and round_state.pips[1-active] <= BIG_BLIND:
+                if can_call and round_state.pips[1-active] <= BIG_BLIND:
                     return CallAction()
                 return FoldAction()
 
@@ -122,19 +144,17 @@ class Player(Bot):
         # If we have a STRONG hand post-flop (we hit the board or had pocket pair)
         # We should bet for value.
         # Simplified: If we have "Good Preflop" cards, we assume we are still decent.
-        if self.is_good_preflop(my_cards):
-             if RaiseAction in legal:
+        if self.is_good_preflop(self.my_ranks, self.my_suits):
+             if can_raise:
                  # Let's Jam to deny equity if we are strong
-                 min_r, max_r = round_state.raise_bounds()
-                 return RaiseAction(max_r)
+                 return RaiseAction(max_raise)
         
         # If we are weak post-flop:
-        if CheckAction in legal: return CheckAction()
+        if can_check: return CheckAction()
         return FoldAction()
 
     def get_discard_action(self, my_cards, board):
-        rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
-        board_suits = [c[1] for c in board]
+        board_suits = [CARD_SUIT[c] for c in board]
         flush_suit = None
         if len(board_suits) == 2 and board_suits[0] == board_suits[1]:
             flush_suit = board_suits[0]
@@ -143,12 +163,12 @@ class Player(Bot):
         lowest_danger_score = float('inf')
         
         for i, card in enumerate(my_cards):
-            card_rank = rank_map[card[0]]
-            card_suit = card[1]
+            card_rank = CARD_RANK[card]
+            card_suit = CARD_SUIT[card]
             
             # Value = Rank + FlushBonus
             value = card_rank
-            if flush_suit and card_suit == flush_suit:
+            if flush_suit is not None and card_suit == flush_suit:
                 value += 20 
             
             if value < lowest_danger_score:
@@ -157,31 +177,26 @@ class Player(Bot):
         
         return DiscardAction(best_discard_index)
 
-    def is_good_preflop(self, cards):
+    def is_good_preflop(self, ranks, suits):
         '''
         Returns True if hand is:
         - Trips
         - Pair (55+)
         - 3 of the same suit AND sum of card values >= 25
         '''
-        rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
-        ranks = [rank_map[c[0]] for c in cards]
-        suits = [c[1] for c in cards]
-        
-        rank_counts = {}
+        # Track the most repeated rank while counting
+        counts = [0] * 13
+        max_count = 0
+        max_rank = -1
         for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-            
-        is_pair = False
-        is_trips = False
-        pair_rank = -1
-        
-        for r, count in rank_counts.items():
-            if count == 2:
-                is_pair = True
-                pair_rank = r
-            elif count == 3:
-                is_trips = True
+            counts[r] += 1
+            if counts[r] > max_count:
+                max_count = counts[r]
+                max_rank = r
+
+        is_trips = max_count >= 3
+        is_pair = max_count == 2
+        pair_rank = max_rank if is_pair else -1
         
         if is_trips: return True
         if is_pair:
@@ -189,7 +204,8 @@ class Player(Bot):
             if pair_rank <= 2: return False
             return True
 
-        if len(set(suits)) == 1:
+        # Compared directly instead of building a set, we hold 2 or 3 cards
+        if suits[0] == suits[1] and (len(suits) < 3 or suits[0] == suits[2]):
             total_val = sum(r + 2 for r in ranks)
             if total_val >= 25: return True
 
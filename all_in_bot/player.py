@@ -10,13 +10,178 @@ from skeleton.actions import FoldAction, CallAction, CheckAction, RaiseAction, D
 from skeleton.states import GameState, TerminalState, RoundState, NUM_ROUNDS, BIG_BLIND, STARTING_STACK
 from skeleton.bot import Bot
 from skeleton.runner import parse_args, run_bot
+from collections import namedtuple
+
+# Raise-size increments over the minimum raise, in big blinds
+BB2, BB3, BB4 = BIG_BLIND * 2, BIG_BLIND * 3, BIG_BLIND * 4
+
+# Hole-card classification returned by get_preflop_tier
+PreflopInfo = namedtuple('PreflopInfo', ['tier', 'has_trips', 'pair_rank', 'is_suited'])
+
+# Rank/suit summary shared by the post-flop helpers, built once per decision
+PostflopFeatures = namedtuple('PostflopFeatures', ['rank_product', 'rank_mask', 'suit_counts',
+                                                   'my_ranks', 'max_board'])
+
+# 13-bit rank masks (bit r set = rank r present) for every straight, A-high down to the wheel
+STRAIGHT_MASKS = tuple(0b1111100000000 >> i for i in range(9)) + (0b1000000001111,)
+
+SUIT_IX = {'c': 0, 'd': 1, 'h': 2, 's': 3}
+
+# Card string -> rank 0..12 / suit 0..3, one lookup each
+CARD_RANK = {r + s: ri for ri, r in enumerate("23456789TJQKA") for s in SUIT_IX}
+CARD_SUIT = {r + s: si for r in "23456789TJQKA" for s, si in SUIT_IX.items()}
+
+# One prime per rank: the product of a hand's primes identifies its rank multiset
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# CactusKev-style card ints:
+#   bits 0-3   rank index 0..12
+#   bits 4-19  suit counter 1 << (4 + 4 * suit), so summing cards counts each suit in its own nibble
+#   bits 20-32 rank bit 1 << (20 + rank)
+#   bits 33+   rank prime
+CARD_INT = {r + s: (PRIMES[ri] << 33) | (1 << (20 + ri)) | (1 << (4 + 4 * si)) | ri
+            for ri, r in enumerate("23456789TJQKA") for s, si in SUIT_IX.items()}
+RANK_FIELD = 0xF
+SUIT_FIELD = 0xFFFF << 4
+SUIT_SHIFTS = (0, 4, 8, 12)
+
+# prime product -> (score, pair_rank), filled by warm_rank_table and lazily by rank_category
+RANK_TABLE = {}
+WARMED_SIZES = set()
+
+def classify_rank_counts(counts):
+    '''
+    Classifies a 13-slot rank-count list for evaluate_postflop_strength.
+    Returns (score, pair_rank): score is set for straights and two pair or better,
+    otherwise pair_rank is the rank of the single pair (-1 for high card)
+    '''
+    rank_mask = 0
+    for r in range(13):
+        if counts[r]:
+            rank_mask |= 1 << r
+
+    has_trips = 3 in counts
+    pair_count = counts.count(2)
+
+    if 4 in counts:
+        return (0.95, -1)  # Quads
+    if has_trips and pair_count:
+        return (0.90, -1)  # Full house
+    if has_trips:
+        return (0.75, -1)  # Trips
+    for m in STRAIGHT_MASKS:
+        if (rank_mask & m) == m:
+            return (0.80, -1)  # Straight
+    if pair_count >= 2:
+        return (0.60, -1)  # Two pair
+    if pair_count == 1:
+        return (None, counts.index(2))
+    return (None, -1)
+
+def rank_category(rank_product):
+    '''Cached classify_rank_counts keyed by prime product; fills RANK_TABLE on a miss'''
+    category = RANK_TABLE.get(rank_product)
+    if category is None:
+        counts = [0] * 13
+        n = rank_product
+        for r, p in enumerate(PRIMES):
+            while n % p == 0:
+                counts[r] += 1
+                n //= p
+        category = RANK_TABLE[rank_product] = classify_rank_counts(counts)
+    return category
+
+def warm_rank_table(num_cards):
+    '''Fills RANK_TABLE for every rank multiset of num_cards cards (at most 4 per rank)'''
+    if num_cards in WARMED_SIZES:
+        return
+    WARMED_SIZES.add(num_cards)
+    counts = [0] * 13
+
+    def fill(r, left, product):
+        if r == 13:
+            if left == 0:
+                RANK_TABLE[product] = classify_rank_counts(counts)
+            return
+        p = PRIMES[r]
+        for k in range(min(4, left) + 1):
+            counts[r] = k
+            fill(r + 1, left - k, product)
+            product *= p
+        counts[r] = 0
+
+    fill(0, num_cards, 1)
+
+def classify_preflop(ranks, is_suited):
+    '''Tier logic behind Player.get_preflop_tier, returns PreflopInfo'''
+    counts = [0] * 13
+    for r in ranks:
+        counts[r] += 1
+
+    has_trips = 3 in counts
+    pair_rank = counts.index(2) if 2 in counts else -1
+
+    # Check for trips - always premium
+    if has_trips:
+        tier = 1
+
+    # Check for pairs
+    elif pair_rank >= 8:  # TT+ (T=8, J=9, Q=10, K=11, A=12)
+        tier = 1  # Premium
+    elif pair_rank >= 3:  # 55-99
+        tier = 2  # Medium
+    elif pair_rank >= 0:  # 22-44
+        tier = 3  # Weak
+
+    # High cards (no pair) - suited with 2+ high cards (J+) is medium
+    elif is_suited and sum(1 for r in ranks if r >= 9) >= 2:
+        tier = 2
+
+    # High cards without pair: 2+ cards K or A
+    elif sum(1 for r in ranks if r >= 11) >= 2:
+        tier = 2
+
+    else:
+        tier = 3  # Weak
+
+    return PreflopInfo(tier, has_trips, pair_rank, is_suited)
+
+# PREFLOP_TABLE[((r1 * 13 + r2) * 13 + r3) * 2 + suited], every ordered 3-card hole
+PREFLOP_TABLE = [classify_preflop((r1, r2, r3), bool(suited))
+                 for r1 in range(13) for r2 in range(13) for r3 in range(13) for suited in (0, 1)]
 
 class Player(Bot):
     def __init__(self):
-        self.rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
+        # Pre-build the rank table for flop and turn decisions (6 and 7 cards) at startup,
+        # river hands (8 cards) are classified lazily
+        for num_cards in (6, 7):
+            warm_rank_table(num_cards)
 
     def handle_new_round(self, game_state, round_state, active):
-        pass
+        # Lockdown bar: blinds we could still lose (1.5/round) plus a 2 chip buffer
+        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
+        self.secure_win_threshold = (rounds_remaining * 1.5) + 2
+        self.cache_hole_cards(round_state.hands[active])
+
+    def cache_hole_cards(self, cards):
+        '''
+        Translates our hole cards once per round (and again after we discard)
+        so get_action doesn't re-parse them on every decision
+        '''
+        self.my_ranks = tuple(CARD_RANK[c] for c in cards)
+        self.my_suits = tuple(CARD_SUIT[c] for c in cards)
+
+        # Hole-card part of the post-flop features, completed with the board later
+        self.hole_product = 1
+        self.hole_rank_bits = 0
+        self.hole_suit_counts = 0
+        for c in cards:
+            x = CARD_INT[c]
+            self.hole_product *= x >> 33
+            self.hole_rank_bits |= x
+            self.hole_suit_counts += x & SUIT_FIELD
+
+        self.cards_dirty = False
 
     def handle_round_over(self, game_state, terminal_state, active):
         pass
@@ -27,23 +192,37 @@ class Player(Bot):
         my_cards = round_state.hands[active]
         board = round_state.board
 
+        # Opponent's discard street: checking is our only move, skip the evaluation
+        if len(legal) == 1 and CheckAction in legal:
+            return CheckAction()
+
         # ---------------------------------------------------------
         # 1. HANDLE DISCARD ACTION
         # ---------------------------------------------------------
         if DiscardAction in legal:
+            # Our hand shrinks to 2 cards once the engine applies this
+            self.cards_dirty = True
             return self.get_discard_action(my_cards, board)
 
+        if self.cards_dirty:
+            self.cache_hole_cards(my_cards)
+
+        can_raise = RaiseAction in legal
+        can_call = CallAction in legal
+        can_check = CheckAction in legal
+
         # ---------------------------------------------------------
         # 2. LOCKDOWN CHECK (Safety Mode)
         # ---------------------------------------------------------
-        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
-        secure_win_threshold = (rounds_remaining * 1.5) + 2
-
-        if game_state.bankroll > secure_win_threshold:
-            if CheckAction in legal:
+        if game_state.bankroll > self.secure_win_threshold:
+            if can_check:
                 return CheckAction()
             return FoldAction()
 
+        # Raise bounds for every sizing branch below
+        if can_raise:
+            min_raise, max_raise = round_state.raise_bounds()
+
         # ---------------------------------------------------------
         # 2b. CAUTION MODE (When ahead, stop shoving)
         # ---------------------------------------------------------
@@ -69,114 +248,85 @@ class Player(Bot):
         # 4. PRE-FLOP STRATEGY
         # ---------------------------------------------------------
         if street == 0:
-            hand_tier = self.get_preflop_tier(my_cards)
+            info = self.get_preflop_tier(self.my_ranks, self.my_suits)
+            hand_tier = info.tier
 
             # FACING ALL-IN OR HUGE BET
             if is_opponent_allin or is_huge_bet:
                 # Only call with SUPER PREMIUM hands (QQ+, trips)
                 # Don't call all-ins with TT/JJ - they lose too often
                 if hand_tier == 1:
-                    # Check if it's actually QQ+ or trips
-                    ranks = [self.rank_map[c[0]] for c in my_cards]
-                    rank_counts = {}
-                    for r in ranks:
-                        rank_counts[r] = rank_counts.get(r, 0) + 1
-
-                    has_trips = any(c == 3 for c in rank_counts.values())
-                    pair_rank = None
-                    for r, c in rank_counts.items():
-                        if c == 2:
-                            pair_rank = r
-
                     # Only call with QQ+ (Q=10) or trips
-                    if has_trips or (pair_rank is not None and pair_rank >= 10):
-                        if CallAction in legal:
+                    if info.has_trips or info.pair_rank >= 10:
+                        if can_call:
                             return CallAction()
 
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
                 return FoldAction()
 
             # CAUTION MODE: Don't shove, just raise small
             if is_caution_mode:
                 if hand_tier == 1:
-                    if RaiseAction in legal:
-                        min_raise, max_raise = round_state.raise_bounds()
+                    if can_raise:
                         # Raise 4-5x BB instead of all-in
-                        raise_amount = min(min_raise + BIG_BLIND * 3, max_raise)
+                        raise_amount = min(min_raise + BB3, max_raise)
                         return RaiseAction(raise_amount)
-                    if CallAction in legal:
+                    if can_call:
                         return CallAction()
                 elif hand_tier == 2:
-                    if RaiseAction in legal:
-                        min_raise, _ = round_state.raise_bounds()
+                    if can_raise:
                         return RaiseAction(min_raise)
-                    if CallAction in legal:
+                    if can_call:
                         return CallAction()
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
                 return FoldAction()
 
             # NORMAL MODE: WE ACT FIRST OR FACING SMALL BET
             if hand_tier == 1:
-                # Check if it's QQ+ or trips (worth shoving)
-                ranks = [self.rank_map[c[0]] for c in my_cards]
-                rank_counts = {}
-                for r in ranks:
-                    rank_counts[r] = rank_counts.get(r, 0) + 1
-
-                has_trips = any(c == 3 for c in rank_counts.values())
-                pair_rank = None
-                for r, c in rank_counts.items():
-                    if c == 2:
-                        pair_rank = r
-
-                if RaiseAction in legal:
-                    min_raise, max_raise = round_state.raise_bounds()
-
+                if can_raise:
                     # Only shove with QQ+ (Q=10) or trips
-                    if has_trips or (pair_rank is not None and pair_rank >= 10):
+                    if info.has_trips or info.pair_rank >= 10:
                         return RaiseAction(max_raise)
                     else:
                         # TT/JJ: raise 5-6x BB, don't shove
-                        raise_amount = min(min_raise + BIG_BLIND * 4, max_raise)
+                        raise_amount = min(min_raise + BB4, max_raise)
                         return RaiseAction(raise_amount)
 
-                if CallAction in legal:
+                if can_call:
                     return CallAction()
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
 
             elif hand_tier == 2:
                 # MEDIUM HAND -> Small raise or call, NOT all-in
-                if RaiseAction in legal:
-                    min_raise, max_raise = round_state.raise_bounds()
+                if can_raise:
                     # Raise 3-4x the big blind, not all-in
-                    raise_amount = min(min_raise + BIG_BLIND * 2, max_raise)
+                    raise_amount = min(min_raise + BB2, max_raise)
                     return RaiseAction(raise_amount)
-                if CallAction in legal:
+                if can_call:
                     return CallAction()
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
 
             else:
                 # WEAK HAND -> Check or fold
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
                 # Only call the minimum blind
-                if CallAction in legal and continue_cost <= BIG_BLIND:
+                if can_call and continue_cost <= BIG_BLIND:
                     return CallAction()
                 return FoldAction()
 
         # ---------------------------------------------------------
         # 5. POST-FLOP STRATEGY
         # ---------------------------------------------------------
-        hand_strength = self.evaluate_postflop_strength(my_cards, board)
+        feat = self.compute_postflop_features(board)
+        hand_strength = self.evaluate_postflop_strength(feat)
 
         # FACING A BET
-        if CallAction in legal and continue_cost > 0:
-            pot_odds = continue_cost / (pot_total + continue_cost)
-
+        if can_call and continue_cost > 0:
             # Against all-in: only call with very strong hands
             if is_opponent_allin or is_huge_bet:
                 if hand_strength >= 0.70:  # Strong made hand
@@ -184,72 +334,76 @@ class Player(Bot):
                 return FoldAction()
 
             # Normal pot odds decision
+            pot_odds = continue_cost / (pot_total + continue_cost)
             if hand_strength > pot_odds:
                 return CallAction()
             return FoldAction()
 
         # WE CAN BET OR CHECK
-        if RaiseAction in legal:
-            min_raise, max_raise = round_state.raise_bounds()
-
+        if can_raise:
             # Minimum bet size of 6 chips to pressure opponent
             min_bet = max(min_raise, 6)
 
             # STRONG HAND (trips+, two pair, flush, straight) -> Bet for value
             if hand_strength >= 0.65:
                 # Bet around 60-75% of pot, minimum 6 chips
-                bet_size = min(max(min_bet, int(pot_total * 0.7)), max_raise)
+                bet_size = min(max(min_bet, (pot_total * 7) // 10), max_raise)
                 return RaiseAction(bet_size)
 
             # GOOD DRAW (flush draw or straight draw) -> Semi-bluff
-            if self.has_strong_draw(my_cards, board):
+            if self.has_strong_draw(feat):
                 # Semi-bluff with decent sizing
-                bet_size = min(max(min_bet, int(pot_total * 0.5)), max_raise)
+                bet_size = min(max(min_bet, pot_total // 2), max_raise)
                 return RaiseAction(bet_size)
 
             # MEDIUM-STRONG HAND (good pair) -> Value bet
             # Only bet with strength >= 0.50 (not 0.40 - too weak)
             if hand_strength >= 0.50:
-                bet_size = min(max(min_bet, int(pot_total * 0.5)), max_raise)
+                bet_size = min(max(min_bet, pot_total // 2), max_raise)
                 return RaiseAction(bet_size)
 
         # Default: check with weak hands
-        if CheckAction in legal:
+        if can_check:
             return CheckAction()
 
         return FoldAction()
 
     def get_discard_action(self, my_cards, board):
         '''Smart discard: keep high cards and flush potential'''
-        board_suits = [c[1] for c in board]
+        board_suits = [CARD_SUIT[c] for c in board]
 
         flush_suit = None
         if len(board_suits) >= 2:
-            suit_counts = {}
+            suit_counts = [0, 0, 0, 0]
+            for s in board_suits:
+                suit_counts[s] += 1
+            # First suit (in board order) showing 2+ cards
             for s in board_suits:
-                suit_counts[s] = suit_counts.get(s, 0) + 1
-            for s, count in suit_counts.items():
-                if count >= 2:
+                if suit_counts[s] >= 2:
                     flush_suit = s
                     break
 
         best_discard_index = 0
         lowest_value = float('inf')
 
+        ranks = [CARD_RANK[c] for c in my_cards]
+        rank_counts = [0] * 13
+        for r in ranks:
+            rank_counts[r] += 1
+
         for i, card in enumerate(my_cards):
-            rank = self.rank_map[card[0]]
-            suit = card[1]
+            rank = ranks[i]
+            suit = CARD_SUIT[card]
 
             # Value = rank (higher is better to keep)
             value = rank
 
             # Bonus for matching flush suit on board
-            if flush_suit and suit == flush_suit:
+            if flush_suit is not None and suit == flush_suit:
                 value += 15
 
             # Bonus for having a pair in hand
-            other_ranks = [self.rank_map[my_cards[j][0]] for j in range(len(my_cards)) if j != i]
-            if rank in other_ranks:
+            if rank_counts[rank] >= 2:
                 value += 20  # Keep paired cards
 
             if value < lowest_value:
@@ -258,106 +412,63 @@ class Player(Bot):
 
         return DiscardAction(best_discard_index)
 
-    def get_preflop_tier(self, cards):
+    def get_preflop_tier(self, ranks, suits):
         '''
-        Returns hand tier:
+        Returns PreflopInfo(tier, has_trips, pair_rank, is_suited), pair_rank = -1 without a pair.
+        Tiers:
         1 = Premium (only hands worth shoving): High pairs (TT+), Trips
         2 = Medium (worth raising small): Medium pairs (55-99), High suited
         3 = Weak (check/fold)
         '''
-        ranks = [self.rank_map[c[0]] for c in cards]
-        suits = [c[1] for c in cards]
+        if len(ranks) == 3:
+            r1, r2, r3 = ranks
+            suited = suits[0] == suits[1] == suits[2]
+            return PREFLOP_TABLE[((r1 * 13 + r2) * 13 + r3) * 2 + suited]
+        return classify_preflop(ranks, len(set(suits)) == 1)
 
-        rank_counts = {}
-        for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        # Check for trips - always premium
-        for count in rank_counts.values():
-            if count == 3:
-                return 1
-
-        # Check for pairs
-        for r, count in rank_counts.items():
-            if count == 2:
-                if r >= 8:  # TT+ (T=8, J=9, Q=10, K=11, A=12)
-                    return 1  # Premium
-                elif r >= 3:  # 55-99
-                    return 2  # Medium
-                else:  # 22-44
-                    return 3  # Weak
-
-        # High cards (no pair) - suited with high cards is medium, otherwise weak
-        if len(set(suits)) == 1:  # All suited
-            high_count = sum(1 for r in ranks if r >= 9)  # J+
-            if high_count >= 2:
-                return 2  # Medium - suited with 2+ high cards
-
-        # High cards without pair
-        if sum(1 for r in ranks if r >= 11) >= 2:  # 2+ cards K or A
-            return 2
-
-        return 3  # Weak
-
-    def evaluate_postflop_strength(self, my_cards, board):
+    def compute_postflop_features(self, board):
+        '''
+        Combines the cached hole cards with the board once per decision so that
+        evaluate_postflop_strength and has_strong_draw can share the counts
+        '''
+        rank_product = self.hole_product
+        rank_bits = self.hole_rank_bits
+        suit_counts = self.hole_suit_counts
+        max_board = 0
+
+        for c in board:
+            x = CARD_INT[c]
+            rank_product *= x >> 33
+            rank_bits |= x
+            suit_counts += x & SUIT_FIELD
+            if x & RANK_FIELD > max_board:
+                max_board = x & RANK_FIELD
+
+        return PostflopFeatures(rank_product, (rank_bits >> 20) & 0x1FFF, suit_counts >> 4,
+                                self.my_ranks, max_board)
+
+    def evaluate_postflop_strength(self, feat):
         '''
         Returns strength score 0.0 to 1.0
         '''
-        all_cards = list(my_cards) + list(board)
-        ranks = [self.rank_map[c[0]] for c in all_cards]
-        suits = [c[1] for c in all_cards]
-
-        rank_counts = {}
-        for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        suit_counts = {}
-        for s in suits:
-            suit_counts[s] = suit_counts.get(s, 0) + 1
+        suit_counts = feat.suit_counts
 
         # Check for flush
-        for count in suit_counts.values():
-            if count >= 5:
+        for shift in SUIT_SHIFTS:
+            if (suit_counts >> shift) & 0xF >= 5:
                 return 0.85
 
-        # Check for quads
-        for count in rank_counts.values():
-            if count == 4:
-                return 0.95
-
-        # Check for full house (trips + pair)
-        has_trips = any(c >= 3 for c in rank_counts.values())
-        has_pair = any(c == 2 for c in rank_counts.values())
-        if has_trips and has_pair:
-            return 0.90
-
-        # Check for trips
-        if has_trips:
-            return 0.75
-
-        # Check for straight
-        sorted_ranks = sorted(set(ranks))
-        for i in range(len(sorted_ranks) - 4):
-            if sorted_ranks[i + 4] - sorted_ranks[i] == 4:
-                return 0.80
-        # Wheel straight
-        if set([0, 1, 2, 3, 12]).issubset(set(ranks)):
-            return 0.80
-
-        # Check for two pair
-        pair_count = sum(1 for c in rank_counts.values() if c == 2)
-        if pair_count >= 2:
-            return 0.60
+        # Quads, full house, trips, straight, two pair
+        score, pair_rank = rank_category(feat.rank_product)
+        if score is not None:
+            return score
 
         # Check for one pair
-        if pair_count == 1:
-            pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
+        if pair_rank >= 0:
             # Check if our hole cards made the pair
-            my_ranks = [self.rank_map[c[0]] for c in my_cards]
-            if my_ranks.count(pair_rank) >= 1:
+            if pair_rank in feat.my_ranks:
                 # We have a pair using our cards
-                board_ranks = [self.rank_map[c[0]] for c in board]
-                max_board = max(board_ranks) if board_ranks else 0
+                max_board = feat.max_board
 
                 if pair_rank > max_board:
                     # Overpair
@@ -373,35 +484,21 @@ class Player(Bot):
                 return 0.25
 
         # High card
-        my_ranks = [self.rank_map[c[0]] for c in my_cards]
-        max_rank = max(my_ranks)
+        max_rank = max(feat.my_ranks)
         return 0.15 + (max_rank / 12) * 0.10
 
-    def has_strong_draw(self, my_cards, board):
+    def has_strong_draw(self, feat):
         '''Returns True if we have a flush draw or open-ended straight draw'''
-        all_cards = list(my_cards) + list(board)
-        suits = [c[1] for c in all_cards]
-        ranks = [self.rank_map[c[0]] for c in all_cards]
-
         # Flush draw (4 of same suit)
-        suit_counts = {}
-        for s in suits:
-            suit_counts[s] = suit_counts.get(s, 0) + 1
-        if any(c == 4 for c in suit_counts.values()):
-            return True
-
-        # Open-ended straight draw (4 consecutive)
-        sorted_ranks = sorted(set(ranks))
-        consecutive = 1
-        for i in range(1, len(sorted_ranks)):
-            if sorted_ranks[i] - sorted_ranks[i-1] == 1:
-                consecutive += 1
-                if consecutive >= 4:
-                    return True
-            else:
-                consecutive = 1
-
-        return False
+        suit_counts = feat.suit_counts
+        for shift in SUIT_SHIFTS:
+            if (suit_counts >> shift) & 0xF == 4:
+                return True
+
+        # Open-ended straight draw (4 consecutive), shifted up one so the ace can also sit below the 2
+        mask = feat.rank_mask
+        mask = (mask << 1) | (mask >> 12)
+        return (mask & (mask >> 1) & (mask >> 2) & (mask >> 3)) != 0
 
 if __name__ == '__main__':
     run_bot(Player(), parse_args())
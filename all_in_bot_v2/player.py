@@ -16,13 +16,104 @@ from skeleton.states import GameState, TerminalState, RoundState, NUM_ROUNDS, BI
 from skeleton.bot import Bot
 from skeleton.runner import parse_args, run_bot
 
+# Card string -> rank 0..12 ("2" = 0 ... "A" = 12), one dict hit per card with no c[0] slice
+CARD_RANK = {r + s: i for i, r in enumerate("23456789TJQKA") for s in "cdhs"}
+
+# Card string -> bit-packed int for get_postflop_strength:
+#   bits 0-12   one-hot rank, so OR-ing cards gives the 13-bit rank mask
+#   bits 16-31  suit counter 1 << (16 + 4 * suit), so summing cards counts each suit in its own nibble
+#   bits 32-70  rank counter 1 << (32 + 3 * rank), so summing cards packs the rank histogram
+# No field can carry into the next one for the 8 cards a hand can reach
+HIST_SHIFT = 32
+CARD_BITS = {r + s: (1 << i) | (1 << (16 + 4 * si)) | (1 << (HIST_SHIFT + 3 * i))
+             for i, r in enumerate("23456789TJQKA") for si, s in enumerate("cdhs")}
+RANK_FIELD = 0x1FFF
+SUIT_FIELD = 0xFFFF << 16
+SUIT_SHIFTS = (16, 20, 24, 28)
+WHEEL_MASK = 0b1000000001111  # A-2-3-4-5
+
+# packed rank histogram -> (has_quads, has_trips, pair_count, pair_rank), filled by rank_counts_info
+RANK_INFO = {}
+
+def rank_counts_info(hist):
+    '''
+    Classifies a packed rank histogram into (has_quads, has_trips, pair_count, pair_rank),
+    caching the result in RANK_INFO. A miss reads each 3-bit count straight off the int
+    '''
+    info = RANK_INFO.get(hist)
+    if info is None:
+        has_quads = False
+        has_trips = False
+        pair_count = 0
+        pair_rank = -1
+        rest = hist
+        r = 0
+        while rest:
+            count = rest & 7
+            if count == 4:
+                has_quads = True
+            elif count == 3:
+                has_trips = True
+            elif count == 2:
+                pair_count += 1
+                pair_rank = r
+            rest >>= 3
+            r += 1
+        info = RANK_INFO[hist] = (has_quads, has_trips, pair_count, pair_rank)
+    return info
+
+def classify_preflop(ranks, is_suited):
+    '''Tier logic behind Player.get_preflop_tier, returns the tier 0-3 described there'''
+    # Count ranks, noting the most repeated one as we go
+    counts = [0] * 13
+    max_count = 0
+    max_rank = -1
+    for r in ranks:
+        counts[r] += 1
+        if counts[r] > max_count:
+            max_count = counts[r]
+            max_rank = r
+
+    is_trips = max_count >= 3
+    is_pair = max_count == 2
+    pair_rank = max_rank if is_pair else -1
+
+    # TIER 1: Trips or QQ+ (Q=10, K=11, A=12)
+    if is_trips:
+        return 1
+    if is_pair and pair_rank >= 10:  # QQ+
+        return 1
+
+    # TIER 2: TT-JJ (T=8, J=9)
+    if is_pair and pair_rank >= 8:  # TT-JJ
+        return 2
+
+    # TIER 3: 55-99 (5=3, 6=4, 7=5, 8=6, 9=7)
+    if is_pair and pair_rank >= 3:  # 55-99
+        return 3
+
+    # TIER 3: Suited high cards (sum >= 25)
+    if is_suited:
+        total_val = sum(r + 2 for r in ranks)
+        if total_val >= 25:
+            return 3
+
+    # TIER 0: Weak hand
+    return 0
+
+# PREFLOP_TABLE[((r1 * 13 + r2) * 13 + r3) * 2 + suited], every ordered 3-card hole
+PREFLOP_TABLE = [classify_preflop((r1, r2, r3), bool(suited))
+                 for r1 in range(13) for r2 in range(13) for r3 in range(13) for suited in (0, 1)]
+
 class Player(Bot):
 
     def __init__(self):
-        self.rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
+        pass
 
     def handle_new_round(self, game_state, round_state, active):
-        pass
+        # Bankroll above which folding every remaining round still wins
+        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
+        self.secure_win_threshold = (rounds_remaining * 1.5) + 2
 
     def handle_round_over(self, game_state, terminal_state, active):
         pass
@@ -39,31 +130,34 @@ class Player(Bot):
         if DiscardAction in legal:
             return self.get_discard_action(my_cards, board)
 
+        can_raise = RaiseAction in legal
+        can_call = CallAction in legal
+        can_check = CheckAction in legal
+
         # ---------------------------------------------------------
         # 2. LOCKDOWN CHECK (Safety Mode)
         # ---------------------------------------------------------
-        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
-        secure_win_threshold = (rounds_remaining * 1.5) + 2
-
-        if game_state.bankroll > secure_win_threshold:
-            if CheckAction in legal:
+        if game_state.bankroll > self.secure_win_threshold:
+            if can_check:
                 return CheckAction()
             return FoldAction()
 
+        # Betting situation and raise bounds are fixed for this decision, look them up once
+        pips = round_state.pips
+        my_pip = pips[active]
+        opp_pip = pips[1 - active]
+        continue_cost = opp_pip - my_pip
+        if can_raise:
+            min_raise, max_raise = round_state.raise_bounds()
+
         # ---------------------------------------------------------
         # 3. PRE-FLOP STRATEGY (Variable Sizing)
         # ---------------------------------------------------------
         if street == 0:
-            my_pip = round_state.pips[active]
-            opp_pip = round_state.pips[1 - active]
-            continue_cost = opp_pip - my_pip
-
             hand_tier = self.get_preflop_tier(my_cards)
 
             if hand_tier > 0:  # We have a playable hand
-                if RaiseAction in legal:
-                    min_raise, max_raise = round_state.raise_bounds()
-
+                if can_raise:
                     # TIER 1: QQ+ or Trips -> ALL-IN
                     if hand_tier == 1:
                         return RaiseAction(max_raise)
@@ -81,25 +175,25 @@ class Player(Bot):
                         raise_amount = min(max(min_raise, BIG_BLIND * 5), max_raise)
                         # If opponent already raised big, just call or fold
                         if continue_cost > 15:
-                            if CallAction in legal:
+                            if can_call:
                                 return CallAction()
                             return FoldAction()
                         return RaiseAction(raise_amount)
 
-                if CallAction in legal:
+                if can_call:
                     return CallAction()
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
             else:
                 # WEAK HAND STRATEGY
 
                 # 1. If we can Check, just Check
-                if CheckAction in legal:
+                if can_check:
                     return CheckAction()
 
                 # 2. If facing a SMALL raise (<=15), call to see the flop
                 #    This stops us bleeding chips to sophisticated raise-folders
-                if CallAction in legal and continue_cost <= 15:
+                if can_call and continue_cost <= 15:
                     return CallAction()
 
                 # 3. Facing a large raise or all-in -> Fold
@@ -108,10 +202,7 @@ class Player(Bot):
         # ---------------------------------------------------------
         # 4. POST-FLOP STRATEGY (Improved)
         # ---------------------------------------------------------
-        my_pip = round_state.pips[active]
-        opp_pip = round_state.pips[1 - active]
         pot_total = my_pip + opp_pip
-        continue_cost = opp_pip - my_pip
         my_stack = round_state.stacks[active]
 
         # Evaluate our hand strength
@@ -123,17 +214,16 @@ class Player(Bot):
             if hand_strength >= 0.50:  # Overpair, top pair, or better
                 # Call one bet if it's not too large (<=50% of our stack)
                 if continue_cost <= my_stack * 0.5:
-                    if CallAction in legal:
+                    if can_call:
                         return CallAction()
 
             # Weak hand or huge bet -> Fold
             return FoldAction()
 
         # WE CAN CHECK OR BET
-        if CheckAction in legal:
+        if can_check:
             # Bet with decent hands for value
-            if hand_strength >= 0.45 and RaiseAction in legal:
-                min_raise, max_raise = round_state.raise_bounds()
+            if hand_strength >= 0.45 and can_raise:
                 # Bet ~50% of pot, minimum 4 chips
                 bet_size = max(4, int(pot_total * 0.5))
                 bet_size = min(max(min_raise, bet_size), max_raise)
@@ -147,29 +237,13 @@ class Player(Bot):
 
     def get_discard_action(self, my_cards, board):
         '''Smart discard: avoid giving opponent flush cards'''
-        board_suits = [c[1] for c in board]
-
-        flush_suit = None
-        if len(board_suits) == 2 and board_suits[0] == board_suits[1]:
-            flush_suit = board_suits[0]
-
-        best_discard_index = 0
-        lowest_danger_score = float('inf')
+        # Flush threat only when the 2-card flop is suited, read straight off the cards
+        flush_suit = board[0][1] if len(board) == 2 and board[0][1] == board[1][1] else None
 
-        for i, card in enumerate(my_cards):
-            card_rank = self.rank_map[card[0]]
-            card_suit = card[1]
-
-            danger_score = card_rank
-
-            if flush_suit and card_suit == flush_suit:
-                danger_score += 100
-
-            if danger_score < lowest_danger_score:
-                lowest_danger_score = danger_score
-                best_discard_index = i
-
-        return DiscardAction(best_discard_index)
+        # Danger = rank, +100 for a card that would complete the board's flush draw.
+        # index(min()) keeps the first card on ties, like the old strict < scan
+        danger_scores = [CARD_RANK[card] + (100 if card[1] == flush_suit else 0) for card in my_cards]
+        return DiscardAction(danger_scores.index(min(danger_scores)))
 
     def get_preflop_tier(self, cards):
         '''
@@ -179,106 +253,70 @@ class Player(Bot):
         2 = Strong (TT-JJ) -> Raise 6x BB
         3 = Medium (55-99, suited high cards) -> Raise 5x BB
         '''
-        ranks = [self.rank_map[c[0]] for c in cards]
-        suits = [c[1] for c in cards]
-
-        rank_counts = {}
-        for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        is_pair = False
-        is_trips = False
-        pair_rank = -1
-
-        for r, count in rank_counts.items():
-            if count == 2:
-                is_pair = True
-                pair_rank = r
-            elif count == 3:
-                is_trips = True
-
-        # TIER 1: Trips or QQ+ (Q=10, K=11, A=12)
-        if is_trips:
-            return 1
-        if is_pair and pair_rank >= 10:  # QQ+
-            return 1
-
-        # TIER 2: TT-JJ (T=8, J=9)
-        if is_pair and pair_rank >= 8:  # TT-JJ
-            return 2
-
-        # TIER 3: 55-99 (5=3, 6=4, 7=5, 8=6, 9=7)
-        if is_pair and pair_rank >= 3:  # 55-99
-            return 3
-
-        # TIER 3: Suited high cards (sum >= 25)
-        if len(set(suits)) == 1:
-            total_val = sum(r + 2 for r in ranks)
-            if total_val >= 25:
-                return 3
-
-        # TIER 0: Weak hand
-        return 0
+        if len(cards) == 3:
+            c1, c2, c3 = cards
+            suited = c1[1] == c2[1] == c3[1]
+            return PREFLOP_TABLE[((CARD_RANK[c1] * 13 + CARD_RANK[c2]) * 13 + CARD_RANK[c3]) * 2 + suited]
+        return classify_preflop([CARD_RANK[c] for c in cards], len(set(c[1] for c in cards)) == 1)
 
     def get_postflop_strength(self, my_cards, board):
         '''
         Returns a strength score from 0.0 to 1.0
         Used to decide whether to bet/call post-flop
         '''
-        all_cards = list(my_cards) + list(board)
-        ranks = [self.rank_map[c[0]] for c in all_cards]
-        suits = [c[1] for c in all_cards]
-        my_ranks = [self.rank_map[c[0]] for c in my_cards]
-        board_ranks = [self.rank_map[c[0]] for c in board] if board else []
-
-        rank_counts = {}
-        for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        suit_counts = {}
-        for s in suits:
-            suit_counts[s] = suit_counts.get(s, 0) + 1
+        # Rank masks, suit nibbles and rank histogram straight from the packed cards,
+        # hole cards and board kept apart so the pair checks need no rank lists
+        hole_mask = 0
+        packed = 0
+        for c in my_cards:
+            x = CARD_BITS[c]
+            hole_mask |= x
+            packed += x
+        board_mask = 0
+        for c in board:
+            x = CARD_BITS[c]
+            board_mask |= x
+            packed += x
+        hole_mask &= RANK_FIELD
+        board_mask &= RANK_FIELD
+        rank_mask = hole_mask | board_mask
+        suit_counts = packed & SUIT_FIELD
+
+        # Pair/trips/quads come from a table lookup once this histogram has been seen
+        has_quads, has_trips, pair_count, pair_rank = rank_counts_info(packed >> HIST_SHIFT)
 
         # Check for flush (5+ of same suit)
-        for count in suit_counts.values():
-            if count >= 5:
+        for shift in SUIT_SHIFTS:
+            if (suit_counts >> shift) & 0xF >= 5:
                 return 0.85
 
         # Check for quads
-        for count in rank_counts.values():
-            if count == 4:
-                return 0.95
+        if has_quads:
+            return 0.95
 
         # Check for full house
-        has_trips = any(c >= 3 for c in rank_counts.values())
-        has_pair = any(c == 2 for c in rank_counts.values())
-        if has_trips and has_pair:
+        if has_trips and pair_count:
             return 0.90
 
         # Check for trips
         if has_trips:
             return 0.75
 
-        # Check for straight
-        sorted_ranks = sorted(set(ranks))
-        for i in range(len(sorted_ranks) - 4):
-            if sorted_ranks[i + 4] - sorted_ranks[i] == 4:
-                return 0.80
-        if set([0, 1, 2, 3, 12]).issubset(set(ranks)):  # Wheel
+        # Check for straight: five consecutive rank bits, or the wheel
+        if rank_mask & (rank_mask >> 1) & (rank_mask >> 2) & (rank_mask >> 3) & (rank_mask >> 4):
+            return 0.80
+        if (rank_mask & WHEEL_MASK) == WHEEL_MASK:
             return 0.80
 
         # Check for two pair
-        pair_count = sum(1 for c in rank_counts.values() if c == 2)
         if pair_count >= 2:
             return 0.60
 
         # Check for one pair
         if pair_count == 1:
-            pair_rank = [r for r, c in rank_counts.items() if c == 2][0]
-
             # Check if we made the pair (not just board pair)
-            if pair_rank in my_ranks:
-                max_board = max(board_ranks) if board_ranks else 0
+            if (hole_mask >> pair_rank) & 1:
+                max_board = max(board_mask.bit_length() - 1, 0)
 
                 if pair_rank > max_board:
                     # OVERPAIR - very strong, defend this!
@@ -294,7 +332,7 @@ class Player(Bot):
                 return 0.25
 
         # High card only
-        max_rank = max(my_ranks) if my_ranks else 0
+        max_rank = max(hole_mask.bit_length() - 1, 0)
         return 0.15 + (max_rank / 12) * 0.10
 
 
@@ -7,6 +7,9 @@ from skeleton.states import GameState, TerminalState, RoundState, NUM_ROUNDS, BI
 from skeleton.bot import Bot
 from skeleton.runner import parse_args, run_bot
 
+# Card string -> rank 0..12 ("2" = 0 ... "A" = 12), built once instead of on every call
+CARD_RANK = {r + s: i for i, r in enumerate("23456789TJQKA") for s in "cdhs"}
+
 class Player(Bot):
     '''
     A bot that:
@@ -24,7 +27,13 @@ class Player(Bot):
         pass
 
     def handle_new_round(self, game_state, round_state, active):
-        pass
+        # Calculate rounds remaining (including current one)
+        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
+
+        # Average cost to fold every hand is 1.5 chips/round.
+        # If we have more chips than we can possibly lose, stop betting.
+        # We add a small buffer (+2) to handle the variance of ending on a Big Blind.
+        self.secure_win_threshold = (rounds_remaining * 1.5) + 2
 
     def handle_round_over(self, game_state, terminal_state, active):
         pass
@@ -39,50 +48,12 @@ class Player(Bot):
         # 1. HANDLE DISCARD ACTION (Always required if legal)
         # ---------------------------------------------------------
         if DiscardAction in legal:
-            # Smart Strategy: Avoid discarding flush connectivity or high cards
-            rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
-            
-            # Analyze Board Texture
-            board_suits = [c[1] for c in board]
-            
-            # Check if board has flush potential (2 of same suit)
-            flush_suit = None
-            if len(board_suits) == 2 and board_suits[0] == board_suits[1]:
-                flush_suit = board_suits[0]
-            
-            best_discard_index = 0
-            lowest_danger_score = float('inf')
-            
-            for i, card in enumerate(my_cards):
-                card_rank = rank_map[card[0]]
-                card_suit = card[1]
-                
-                # Base Danger Score = Rank (0-12)
-                # Higher rank = Higher danger to leave on board for opponent
-                danger_score = card_rank
-                
-                # Flush Danger Penalty
-                if flush_suit and card_suit == flush_suit:
-                    danger_score += 100
-                
-                if danger_score < lowest_danger_score:
-                    lowest_danger_score = danger_score
-                    best_discard_index = i
-            
-            return DiscardAction(best_discard_index)
+            return self.get_discard_action(my_cards, board)
 
         # ---------------------------------------------------------
         # 2. LOCKDOWN CHECK (Safety Mode)
         # ---------------------------------------------------------
-        # Calculate rounds remaining (including current one)
-        rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
-        
-        # Average cost to fold every hand is 1.5 chips/round.
-        # If we have more chips than we can possibly lose, stop betting.
-        # We add a small buffer (+2) to handle the variance of ending on a Big Blind.
-        secure_win_threshold = (rounds_remaining * 1.5) + 2
-        
-        if game_state.bankroll > secure_win_threshold:
+        if game_state.bankroll > self.secure_win_threshold:
             # We have won. Do not risk any chips.
             if CheckAction in legal:
                 return CheckAction()
@@ -131,6 +102,32 @@ class Player(Bot):
         # Fold to any aggression (since we only have a bad hand here)
         return FoldAction()
 
+    def get_discard_action(self, my_cards, board):
+        '''Smart discard: avoid giving opponent flush cards'''
+        # Suit of a 2-card suited board (flush potential), else None
+        flush_suit = board[0][1] if len(board) == 2 and board[0][1] == board[1][1] else None
+        
+        best_discard_index = 0
+        lowest_danger_score = float('inf')
+        
+        for i, card in enumerate(my_cards):
+            card_rank = CARD_RANK[card]
+            card_suit = card[1]
+            
+            # Base Danger Score = Rank (0-12)
+            # Higher rank = Higher danger to leave on board for opponent
+            danger_score = card_rank
+            
+            # Flush Danger Penalty
+            if flush_suit and card_suit == flush_suit:
+                danger_score += 100
+            
+            if danger_score < lowest_danger_score:
+                lowest_danger_score = danger_score
+                best_discard_index = i
+        
+        return DiscardAction(best_discard_index)
+
     def is_good_preflop(self, cards):
         '''
         Returns True if hand is:
@@ -138,25 +135,22 @@ class Player(Bot):
         - Pair (55+)
         - 3 of the same suit AND sum of card values >= 25
         '''
-        rank_map = {r: i for i, r in enumerate("23456789TJQKA")}
-        ranks = [rank_map[c[0]] for c in cards]
+        ranks = [CARD_RANK[c] for c in cards]
         suits = [c[1] for c in cards]
         
-        # Count rank frequencies
-        rank_counts = {}
+        # Count rank frequencies and the most repeated rank
+        counts = [0] * 13
+        max_count = 0
+        max_rank = -1
         for r in ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-            
-        is_pair = False
-        is_trips = False
-        pair_rank = -1
-        
-        for r, count in rank_counts.items():
-            if count == 2:
-                is_pair = True
-                pair_rank = r
-            elif count == 3:
-                is_trips = True
+            counts[r] += 1
+            if counts[r] > max_count:
+                max_count = counts[r]
+                max_rank = r
+
+        is_trips = max_count >= 3
+        is_pair = max_count == 2
+        pair_rank = max_rank if is_pair else -1
         
         # 1. Pairs / Trips Logic
         if is_trips:
@@ -169,8 +163,8 @@ class Player(Bot):
             # Otherwise (55+), it's good
             return True
 
-        # 2. Suited Logic (Flush potential)
-        if len(set(suits)) == 1:
+        # 2. Suited Logic (Flush potential), compared directly instead of building a set
+        if suits[0] == suits[1] and (len(suits) < 3 or suits[0] == suits[2]):
             # Sum of face values (2=2 ... A=14)
             total_val = sum(r + 2 for r in ranks)
             if total_val >= 25:
@@ -7,13 +7,12 @@ Fixes:
 - Postflop raise sizing fixed to be consistently "raise-to".
 - Equity sim improved: opponent keeps best 2 *board-aware* (by evaluating keep2 + board).
 - Equity caching actually used.
-- Hand evaluator upgraded (accurate 7-card best-5 via 21 combos) — slower than the old hack,
-  but much less wrong. Iterations are adjusted + cached to keep runtime reasonable.
+- Hand evaluator upgraded (accurate best-5 of 5-8 cards via import-time score tables, or pkrbot
+  when installed). Iterations are adjusted + cached to keep runtime reasonable.
 """
 
 import random
-from collections import defaultdict, Counter
-from itertools import combinations
+from itertools import combinations, combinations_with_replacement
 
 from skeleton.actions import FoldAction, CallAction, CheckAction, RaiseAction, DiscardAction
 from skeleton.states import GameState, TerminalState, RoundState, NUM_ROUNDS, STARTING_STACK
@@ -22,21 +21,241 @@ from skeleton.runner import parse_args, run_bot
 
 # Try to import pkrbot for C++ speed. If not available, use Python evaluator.
 try:
-    import pkrbot  # noqa: F401
+    import pkrbot
     PKRBOT_AVAILABLE = True
 except ImportError:
     PKRBOT_AVAILABLE = False
 
 
+# One bit per action type for get_action's legal-move checks
+FOLD_BIT, CALL_BIT, CHECK_BIT, RAISE_BIT, DISCARD_BIT = 1, 2, 4, 8, 16
+ACTION_BITS = {FoldAction: FOLD_BIT, CallAction: CALL_BIT, CheckAction: CHECK_BIT,
+               RaiseAction: RAISE_BIT, DiscardAction: DISCARD_BIT}
+
 RANK_TO_INT = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
                'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
 
 
+# ============================================================
+# Cactus-Kev card encoding + lookup-table hand scores
+# ============================================================
+# One int per card:  xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+#   b = one-hot rank bit (16 + rank), cdhs = suit bit, r = rank 0..12, p = prime of the rank
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+CARD_INT = {r + s: (1 << (16 + ri)) | (0x8000 >> si) | (ri << 8) | PRIMES[ri]
+            for ri, r in enumerate("23456789TJQKA") for si, s in enumerate("cdhs")}
+
+# Every card as a CARD_INT, in deck order, so the simulated deck is built without the strings
+FULL_DECK = tuple(CARD_INT[r + s] for r in "23456789TJQKA" for s in "cdhs")
+
+# One bit per card (0..51) for eq_cache keys
+CARD_BIT = {r + s: 1 << (4 * ri + si) for ri, r in enumerate("23456789TJQKA") for si, s in enumerate("cdhs")}
+
+
+def pack_ranks(ranks):
+    """
+    Descending ranks as one int, 4 bits each, so comparing two packs of the same length
+    orders them like comparing the rank tuples.
+    """
+    packed = 0
+    for r in ranks:
+        packed = (packed << 4) | r
+    return packed
+
+
+def classify_hand(ranks, is_flush):
+    """
+    Comparable tuple for a 5-card hand (ranks 2..14), higher tuple => stronger hand.
+    Kicker lists are flattened with pack_ranks, so every entry is an int.
+    Categories:
+    8: straight flush
+    7: four of a kind
+    6: full house
+    5: flush
+    4: straight
+    3: three of a kind
+    2: two pair
+    1: one pair
+    0: high card
+    Only used to build the score tables below.
+    """
+    ranks = sorted(ranks, reverse=True)
+
+    # One pass from the top rank down collects the distinct ranks and the two most repeated
+    # (count, rank) groups, higher rank first on equal counts
+    rank_counts = [0] * 15
+    for r in ranks:
+        rank_counts[r] += 1
+    uniq = []
+    c1_rank = c1_cnt = c2_rank = c2_cnt = 0
+    for r in range(14, 1, -1):
+        cnt = rank_counts[r]
+        if cnt:
+            uniq.append(r)
+            if cnt > c1_cnt:
+                c2_rank, c2_cnt = c1_rank, c1_cnt
+                c1_rank, c1_cnt = r, cnt
+            elif cnt > c2_cnt:
+                c2_rank, c2_cnt = r, cnt
+
+    # Straight detection (handle wheel A-5)
+    is_straight = False
+    straight_high = 0
+    if len(uniq) == 5:
+        if uniq[0] - uniq[4] == 4:
+            is_straight = True
+            straight_high = uniq[0]
+        elif uniq == [14, 5, 4, 3, 2]:
+            is_straight = True
+            straight_high = 5
+
+    if is_flush and is_straight:
+        return (8, straight_high)
+
+    # Four / Full house / Trips / Pairs
+    if c1_cnt == 4:
+        kicker = max(r for r in ranks if r != c1_rank)
+        return (7, c1_rank, kicker)
+
+    if c1_cnt == 3 and c2_cnt == 2:
+        return (6, c1_rank, c2_rank)
+
+    if is_flush:
+        # Flush breaks ties by all five ranks
+        return (5, pack_ranks(ranks))
+
+    if is_straight:
+        return (4, straight_high)
+
+    if c1_cnt == 3:
+        kickers = [r for r in ranks if r != c1_rank]
+        return (3, c1_rank, pack_ranks(kickers))
+
+    if c1_cnt == 2 and c2_cnt == 2:
+        high_pair = max(c1_rank, c2_rank)
+        low_pair = min(c1_rank, c2_rank)
+        kicker = max(r for r in ranks if r != high_pair and r != low_pair)
+        return (2, high_pair, low_pair, kicker)
+
+    if c1_cnt == 2:
+        pair_rank = c1_rank
+        kickers = [r for r in ranks if r != pair_rank]
+        return (1, pair_rank, pack_ranks(kickers))
+
+    return (0, pack_ranks(ranks))
+
+
+def build_score_tables():
+    """
+    Ranks every 5-card hand class by classify_hand into one int scale (higher = stronger).
+    Returns (flush_scores, rank_scores):
+    - flush_scores[rank_mask]: all cards one suit, indexed by the OR of the 13 rank bits
+    - rank_scores[prime_product]: everything else, keyed by the product of the rank primes
+    """
+    flush_classes = {}
+    rank_classes = {}
+    for combo in combinations(range(13), 5):
+        mask = 0
+        for r in combo:
+            mask |= 1 << r
+        flush_classes[mask] = classify_hand([r + 2 for r in combo], True)
+    for combo in combinations_with_replacement(range(13), 5):
+        if combo[0] == combo[4]:
+            continue  # five of a kind
+        product = 1
+        for r in combo:
+            product *= PRIMES[r]
+        rank_classes[product] = classify_hand([r + 2 for r in combo], False)
+
+    order = {cls: i + 1 for i, cls in enumerate(sorted(set(flush_classes.values()) | set(rank_classes.values())))}
+    flush_scores = [0] * 8192
+    for mask, cls in flush_classes.items():
+        flush_scores[mask] = order[cls]
+    rank_scores = {product: order[cls] for product, cls in rank_classes.items()}
+    return flush_scores, rank_scores
+
+
+FLUSH_SCORES, RANK_SCORES = build_score_tables()
+
+# 6-8 card hands: the best non-flush 5 depends only on the rank multiset and the best flush 5
+# only on the flush suit's rank mask, so eval7 needs two lookups instead of 6/21/56 combos.
+# Both filled lazily on a miss.
+BEST_RANK_SCORES = {}   # prime product of all ranks -> best RANK_SCORES entry of any 5 of them
+BEST_FLUSH_SCORES = {}  # rank mask of 5+ suited cards -> best FLUSH_SCORES entry of any 5 of them
+
+# Suit bit nibble (c >> 12) & 0xF -> one count per suit in its own nibble, so summing over
+# a hand packs the four suit counts; (counts + 0x3333) & 0x8888 flags any suit with 5+
+SUIT_COUNT = tuple(1 << (4 * (v.bit_length() - 1)) if v in (1, 2, 4, 8) else 0 for v in range(16))
+
+# Board texture for is_board_wet: a 3-bit count per rank and a 4-bit count per suit, summed
+# over the board (6 cards at most, so no field overflows)
+WET_RANK = {r: 1 << (3 * ri) for ri, r in enumerate("23456789TJQKA")}
+WET_SUIT = {s: 1 << (4 * si) for si, s in enumerate("cdhs")}
+# rank counts * WET_WINDOW puts the card count of ranks j-4..j in 3-bit field j,
+# WET_LOW picks bit 0 of each of those 17 fields
+WET_WINDOW = sum(1 << (3 * k) for k in range(5))
+WET_LOW = sum(1 << (3 * j) for j in range(17))
+
+
+def best_rank_score(product):
+    """Fills BEST_RANK_SCORES for a prime product of 6+ ranks"""
+    ranks = []
+    n = product
+    for p in PRIMES:
+        while n % p == 0:
+            ranks.append(p)
+            n //= p
+    best = 0
+    for p1, p2, p3, p4, p5 in set(combinations(ranks, 5)):
+        score = RANK_SCORES[p1 * p2 * p3 * p4 * p5]
+        if score > best:
+            best = score
+    BEST_RANK_SCORES[product] = best
+    return best
+
+
+def best_flush_score(rank_mask):
+    """Fills BEST_FLUSH_SCORES for the rank mask of 5+ cards of one suit"""
+    bits = [1 << r for r in range(13) if rank_mask & (1 << r)]
+    best = 0
+    for b1, b2, b3, b4, b5 in combinations(bits, 5):
+        score = FLUSH_SCORES[b1 | b2 | b3 | b4 | b5]
+        if score > best:
+            best = score
+    BEST_FLUSH_SCORES[rank_mask] = best
+    return best
+
+
+def load_pkrbot_cards():
+    """
+    CARD_INT -> pkrbot.Card map, or None unless pkrbot.evaluate scores 5-8 card lists
+    of them as ints with higher = stronger (how the engine calls it at showdown).
+    Probed once so an API mismatch falls back to the Python evaluator instead of crashing.
+    """
+    try:
+        cards = {x: pkrbot.Card(c) for c, x in CARD_INT.items()}
+        probe = [cards[CARD_INT[c]] for c in ("As", "Ks", "Qs", "Js", "Ts", "9d", "2c", "3h")]
+        for n in (5, 6, 7, 8):
+            if not isinstance(pkrbot.evaluate(probe[:n]), int):
+                return None
+        # Royal flush must outscore the K-high straight
+        if pkrbot.evaluate(probe[:5]) <= pkrbot.evaluate(probe[1:6]):
+            return None
+    except Exception:
+        return None
+    return cards
+
+
+PKRBOT_CARDS = load_pkrbot_cards() if PKRBOT_AVAILABLE else None
+
+
 class Player(Bot):
     def __init__(self):
         self.lockdown_mode = False
         self.rng = random.Random()
         self.eq_cache = {}
+        self.discard_cache = {}  # (sorted hand, sorted board) -> card to discard
+        self.preflop_cache = None  # (hand, points) for this round's hole cards
 
     # ----------------------------
     # Engine hooks
@@ -45,12 +264,20 @@ class Player(Bot):
         # Periodically clear cache to avoid uncontrolled growth
         if game_state.round_num % 10 == 0:
             self.eq_cache = {}
+            self.discard_cache = {}
 
         # SAFETY LOCKDOWN: if we're far enough ahead, we play check/fold (but ONLY when not discarding)
         rounds_remaining = NUM_ROUNDS - game_state.round_num + 1
         secure_threshold = (rounds_remaining * 1.5) + 10.0
         self.lockdown_mode = (game_state.bankroll > secure_threshold)
 
+        # Hole cards are fixed until the discard, so score them once for every preflop decision
+        my_cards = round_state.hands[active]
+        if my_cards:
+            self.preflop_cache = (tuple(my_cards), self.evaluate_preflop_points(my_cards))
+        else:
+            self.preflop_cache = None
+
     def handle_round_over(self, game_state, terminal_state, active):
         pass
 
@@ -59,30 +286,31 @@ class Player(Bot):
     # ----------------------------
     def get_action(self, game_state, round_state, active):
         legal = round_state.legal_actions()
+        legal_mask = self.legal_mask(legal)
         street = round_state.street
         my_cards = round_state.hands[active]
         board = round_state.board
 
         # 0) DISCARD OVERRIDES EVERYTHING (THIS FIXES YOUR DISCONNECT / MISFORMAT)
-        if self.has_action(legal, DiscardAction):
+        if legal_mask & DISCARD_BIT:
             return self.get_best_discard(my_cards, board)
 
         # 1) LOCKDOWN (only applies when NOT discarding)
         if self.lockdown_mode:
-            if self.has_action(legal, CheckAction):
+            if legal_mask & CHECK_BIT:
                 return CheckAction()
-            if self.has_action(legal, CallAction):
+            if legal_mask & CALL_BIT:
                 return CallAction()
             return FoldAction()
 
         # 2) PRE-FLOP
         if street == 0:
-            points = self.evaluate_preflop_points(my_cards)
+            points = self.preflop_points(my_cards)
 
             if points >= 35:  # Strong
-                if self.has_action(legal, RaiseAction):
+                if legal_mask & RAISE_BIT:
                     # Random trap (10%)
-                    if self.rng.random() < 0.10 and self.has_action(legal, CallAction):
+                    if self.rng.random() < 0.10 and (legal_mask & CALL_BIT):
                         return CallAction()
 
                     min_r, max_r = round_state.raise_bounds()
@@ -98,21 +326,21 @@ class Player(Bot):
                     amt = max(min_r, min(max_r, target_raise_to))
                     return RaiseAction(amt)
 
-                if self.has_action(legal, CallAction):
+                if legal_mask & CALL_BIT:
                     return CallAction()
-                if self.has_action(legal, CheckAction):
+                if legal_mask & CHECK_BIT:
                     return CheckAction()
                 return FoldAction()
 
             elif points >= 26:  # Playable
-                if self.has_action(legal, CallAction):
+                if legal_mask & CALL_BIT:
                     return CallAction()
-                if self.has_action(legal, CheckAction):
+                if legal_mask & CHECK_BIT:
                     return CheckAction()
                 return FoldAction()
 
             else:  # Trash
-                if self.has_action(legal, CheckAction):
+                if legal_mask & CHECK_BIT:
                     return CheckAction()
                 return FoldAction()
 
@@ -141,7 +369,7 @@ class Player(Bot):
         equity = self.calculate_equity(my_cards, board, street, iterations=base_iters)
 
         # A) VALUE / PROTECTION when strong
-        if equity > 0.60 and self.has_action(legal, RaiseAction):
+        if equity > 0.60 and (legal_mask & RAISE_BIT):
             min_r, max_r = round_state.raise_bounds()
 
             # Desired bet size (as "additional chips" to put in)
@@ -164,9 +392,9 @@ class Player(Bot):
 
         # If we can't raise but we’re strong and can call/check, do it
         if equity > 0.60:
-            if cost_to_call > 0 and self.has_action(legal, CallAction):
+            if cost_to_call > 0 and (legal_mask & CALL_BIT):
                 return CallAction()
-            if self.has_action(legal, CheckAction):
+            if legal_mask & CHECK_BIT:
                 return CheckAction()
 
         # B) POT-ODDS CALLING
@@ -178,31 +406,27 @@ class Player(Bot):
 
             # "Titan margin" to avoid razor-thin spots
             if equity >= required_equity + 0.05:
-                if self.has_action(legal, CallAction):
+                if legal_mask & CALL_BIT:
                     return CallAction()
 
         # C) FREE CHECK
-        if self.has_action(legal, CheckAction):
+        if legal_mask & CHECK_BIT:
             return CheckAction()
 
         # D) FOLD
         return FoldAction()
 
     # ============================================================
-    # Helper: legal action checks (robust)
+    # Helper: legal action bitmask
     # ============================================================
-    def has_action(self, legal_actions, action_cls):
-        # Works whether legal_actions contains classes, instances, or mixed
+    def legal_mask(self, legal_actions):
+        # ACTION_BITS of every legal action, works whether legal_actions contains classes,
+        # instances, or mixed. Matches the skeleton's exact action types only.
+        # Built once per decision so each check is a single AND
+        mask = 0
         for a in legal_actions:
-            if a == action_cls:
-                return True
-            try:
-                if isinstance(a, action_cls):
-                    return True
-            except TypeError:
-                # If a isn't a type / isn't suitable for isinstance
-                pass
-        return False
+            mask |= ACTION_BITS.get(a if isinstance(a, type) else type(a), 0)
+        return mask
 
     # ============================================================
     # Game logic helpers
@@ -221,24 +445,32 @@ class Player(Bot):
         if len(board) < 3:
             return False
 
-        suits = [c[1] for c in board]
-        s_counts = defaultdict(int)
-        for s in suits:
-            s_counts[s] += 1
-        if any(v >= 3 for v in s_counts.values()):
+        rank_counts = suit_counts = 0
+        for c in board:
+            rank_counts += WET_RANK[c[0]]
+            suit_counts += WET_SUIT[c[1]]
+
+        # Nibble + 5 carries into bit 3 exactly when the suit count is 3+
+        if (suit_counts + 0x5555) & 0x8888:
             return True
 
-        ranks = sorted([RANK_TO_INT[c[0]] for c in board])
-        for i in range(len(ranks) - 2):
-            if ranks[i + 2] - ranks[i] <= 4:
-                return True
+        # Window counts include paired ranks, a 3-bit field is 3+ when bit 2 or bits 1 and 0 are set
+        windows = rank_counts * WET_WINDOW
+        return ((windows >> 2) | ((windows >> 1) & windows)) & WET_LOW != 0
 
-        return False
+    def preflop_points(self, cards):
+        # Cached score from handle_new_round, recomputed only if the hand doesn't match
+        key = tuple(cards)
+        cache = self.preflop_cache
+        if cache is None or cache[0] != key:
+            cache = self.preflop_cache = (key, self.evaluate_preflop_points(cards))
+        return cache[1]
 
     def evaluate_preflop_points(self, cards):
-        ranks = sorted([RANK_TO_INT[c[0]] for c in cards], reverse=True)
-        suits = [c[1] for c in cards]
-        points = sum(ranks)
+        c0, c1, c2 = cards
+        ranks = sorted((RANK_TO_INT[c0[0]], RANK_TO_INT[c1[0]], RANK_TO_INT[c2[0]]), reverse=True)
+        suits = (c0[1], c1[1], c2[1])
+        points = ranks[0] + ranks[1] + ranks[2]
 
         # Pairs / trips
         if ranks[0] == ranks[1] or ranks[1] == ranks[2] or ranks[0] == ranks[2]:
@@ -267,6 +499,13 @@ class Player(Bot):
     # ============================================================
     def get_best_discard(self, my_cards, board):
         # MUST return DiscardAction(idx) 0..2
+        # The choice only depends on which cards are where, so a repeat skips all three sims.
+        # Cached as the card itself since the hand's order can differ next time
+        key = (tuple(sorted(my_cards)), tuple(sorted(board)))
+        cached = self.discard_cache.get(key)
+        if cached is not None:
+            return DiscardAction(my_cards.index(cached))
+
         best_idx = 0
         best_eq = -1.0
 
@@ -281,177 +520,178 @@ class Player(Bot):
                 best_eq = eq
                 best_idx = i
 
+        self.discard_cache[key] = my_cards[best_idx]
         return DiscardAction(best_idx)
 
     # ============================================================
     # Equity simulation (Monte Carlo)
     # ============================================================
     def calculate_equity(self, my_cards, board, street, iterations=60):
-        # Cache by (hand, board, street, iters_bucket) — bucket iters so cache hit rate stays high
+        # Cache by (hand, board, street). Iterations are bucketed so cache hit rate stays high
         it_bucket = 40 if iterations <= 45 else 60 if iterations <= 70 else 90 if iterations <= 100 else 120
-        key = (tuple(sorted(my_cards)), tuple(board), street, it_bucket)
 
-        cached = self.eq_cache.get(key)
-        if cached is not None:
-            return cached
-
-        eq = self.calculate_equity_python(my_cards, board, iterations=it_bucket)
-        self.eq_cache[key] = eq
-        return eq
-
-    def calculate_equity_python(self, my_cards, board, iterations):
+        # Packed into one int: hand cards in bits 0-51, board cards in 52-103, then street
+        hand_bits = 0
+        for c in my_cards:
+            hand_bits |= CARD_BIT[c]
+        board_bits = 0
+        for c in board:
+            board_bits |= CARD_BIT[c]
+        key = hand_bits | (board_bits << 52) | (street << 104)
+
+        # Cached as running (wins, iterations) totals, so a bigger bucket only simulates
+        # the iterations it is missing and a smaller one reuses the larger sample
+        wins, done = self.eq_cache.get(key, (0.0, 0))
+        if done < it_bucket:
+            wins += self.simulate_wins(my_cards, board, iterations=it_bucket - done)
+            done = it_bucket
+            self.eq_cache[key] = (wins, done)
+        return wins / float(done)
+
+    def simulate_wins(self, my_cards, board, iterations):
         """
+        Wins over `iterations` random runouts, ties counting half.
         Sim rules approximation:
         - Opponent is dealt 3; they keep best 2 in a board-aware way (maximize eval(keep2+board)).
         - If our my_cards has length 3 (rare here), we also keep best 2 in the same way.
         - Board runs out to 6 public cards total.
         """
         wins = 0.0
-        full_deck = [r + s for r in "23456789TJQKA" for s in "cdhs"]
-        used = set(my_cards + list(board))
-        deck = [c for c in full_deck if c not in used]
-
-        def best_two_from_three(cards3, current_board):
-            best_score = None
-            best_keep = None
-            for drop_i in range(3):
-                keep = [cards3[j] for j in range(3) if j != drop_i]
-                score = self.eval7(keep + current_board)
-                if best_score is None or score > best_score:
-                    best_score = score
-                    best_keep = keep
+
+        # Simulate on Cactus-Kev ints, converted once per call
+        my_cards = [CARD_INT[c] for c in my_cards]
+        board = [CARD_INT[c] for c in board]
+        used = set(my_cards)
+        used.update(board)
+        deck = [c for c in FULL_DECK if c not in used]
+
+        # Hands handed to eval7 live in buffers reused by every iteration, only the
+        # hole-card and runout slots get overwritten
+        nb = len(board)
+        keep_hand = [0, 0] + board
+        # eval7 runs up to 5 times an iteration, bound once instead of looked up on self each time
+        eval7 = self.eval7
+
+        def best_two_from_three(c0, c1, c2):
+            # Keeps are scored against the current board only, which every option shares
+            keep_hand[0] = c1
+            keep_hand[1] = c2
+            best_score = eval7(keep_hand)
+            best_keep = (c1, c2)
+            keep_hand[0] = c0
+            score = eval7(keep_hand)
+            if score > best_score:
+                best_score = score
+                best_keep = (c0, c2)
+            keep_hand[1] = c1
+            score = eval7(keep_hand)
+            if score > best_score:
+                best_keep = (c0, c1)
             return best_keep
 
-        for _ in range(iterations):
-            self.rng.shuffle(deck)
-            d = 0
+        # Choose our 2 (if we still have 3 in some call path). Only the board decides it,
+        # so it is the same for every iteration
+        if len(my_cards) == 3:
+            my2 = best_two_from_three(*my_cards)
+        else:
+            my2 = my_cards
 
-            # Opponent 3 cards
-            opp3 = [deck[d], deck[d + 1], deck[d + 2]]
-            d += 3
+        # Deck slice dealt as the runout to 6 board cards, after the opponent's 3
+        runout_end = 3 + (6 - nb)
+        deck_size = len(deck)
+        randrange = self.rng.randrange
 
-            sim_board = list(board)
+        my_hand = list(my2) + board + deck[3:runout_end]
+        opp_hand = [0, 0] + board + deck[3:runout_end]
+        runout_start = 2 + nb
+        # With the board already complete our hand is the same every iteration, so score it once
+        complete_score = eval7(my_hand) if runout_end == 3 else 0
 
-            # Choose our 2 (if we still have 3 in some call path)
-            if len(my_cards) == 3:
-                my2 = best_two_from_three(my_cards, sim_board)
+        for _ in range(iterations):
+            # Partial Fisher-Yates: only the first runout_end cards get dealt, so only those
+            # need shuffling (a uniform random prefix, like a full shuffle's)
+            for i in range(runout_end):
+                j = randrange(i, deck_size)
+                deck[i], deck[j] = deck[j], deck[i]
+
+            # Opp is dealt 3 and chooses 2 board-aware
+            opp_hand[0], opp_hand[1] = best_two_from_three(deck[0], deck[1], deck[2])
+
+            if runout_end > 3:
+                runout = deck[3:runout_end]
+                my_hand[runout_start:] = runout
+                opp_hand[runout_start:] = runout
+                s1 = eval7(my_hand)
             else:
-                my2 = list(my_cards)
-
-            # Opp chooses 2 board-aware
-            opp2 = best_two_from_three(opp3, sim_board)
-
-            # Runout to 6 board cards
-            while len(sim_board) < 6:
-                sim_board.append(deck[d])
-                d += 1
-
-            s1 = self.eval7(my2 + sim_board)
-            s2 = self.eval7(opp2 + sim_board)
+                s1 = complete_score
+            s2 = eval7(opp_hand)
 
             if s1 > s2:
                 wins += 1.0
             elif s1 == s2:
                 wins += 0.5
 
-        return wins / float(iterations)
+        return wins
 
     # ============================================================
     # Hand evaluation (accurate, Python)
     # ============================================================
     def eval7(self, cards):
         """
-        Returns a comparable tuple representing best 5-card hand from up to 7 cards.
-        Higher tuple => stronger hand.
+        Returns a comparable int score of the best 5-card hand from the CARD_INT cards.
+        Higher score => stronger hand.
         """
-        # If pkrbot exists and you know its API, wire it here safely.
-        # Right now we keep pure Python to avoid API mismatch crashes.
+        # Native evaluator when the import-time probe passed
+        if PKRBOT_CARDS is not None:
+            return pkrbot.evaluate([PKRBOT_CARDS[c] for c in cards])
 
-        # Enumerate all 5-card combos (21 combos for 7 cards; fewer if 6/5 cards)
-        best = None
-        n = len(cards)
-        if n <= 5:
+        if len(cards) == 5:
             return self.eval5(cards)
 
-        for idxs in combinations(range(n), 5):
-            hand = [cards[i] for i in idxs]
-            score = self.eval5(hand)
-            if best is None or score > best:
-                best = score
+        # Best of all 5-card combos without enumerating them: the best rank-only hand
+        # plus, if a suit holds 5+ cards, the best flush within that suit
+        product = 1
+        suit_counts = 0
+        for c in cards:
+            product *= c & 0x3F
+            suit_counts += SUIT_COUNT[(c >> 12) & 0xF]
+
+        best = BEST_RANK_SCORES.get(product)
+        if best is None:
+            best = best_rank_score(product)
+
+        # 8 cards leave room for at most one 5+ suit
+        flush = (suit_counts + 0x3333) & 0x8888
+        if flush:
+            suit_bit = 0x1000 << ((flush.bit_length() - 4) >> 2)
+            rank_mask = 0
+            for c in cards:
+                if c & suit_bit:
+                    rank_mask |= c
+            rank_mask >>= 16
+            flush_best = BEST_FLUSH_SCORES.get(rank_mask)
+            if flush_best is None:
+                flush_best = best_flush_score(rank_mask)
+            if flush_best > best:
+                best = flush_best
         return best
 
     def eval5(self, cards5):
         """
-        5-card evaluator with proper kickers.
-        Categories:
-        8: straight flush
-        7: four of a kind
-        6: full house
-        5: flush
-        4: straight
-        3: three of a kind
-        2: two pair
-        1: one pair
-        0: high card
+        Score of a 5-card hand of CARD_INT ints, with proper kickers (see classify_hand).
+        One table lookup: by rank mask when every card shares a suit, else by prime product.
         """
-        ranks = sorted([RANK_TO_INT[c[0]] for c in cards5], reverse=True)
-        suits = [c[1] for c in cards5]
-
-        rank_counts = Counter(ranks)
-        counts_sorted = sorted(rank_counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
-
-        is_flush = (len(set(suits)) == 1)
-
-        # Straight detection (handle wheel A-5)
-        uniq = sorted(set(ranks), reverse=True)
-        is_straight = False
-        straight_high = 0
-        if len(uniq) == 5:
-            if uniq[0] - uniq[4] == 4:
-                is_straight = True
-                straight_high = uniq[0]
-            elif uniq == [14, 5, 4, 3, 2]:
-                is_straight = True
-                straight_high = 5
-
-        if is_flush and is_straight:
-            return (8, straight_high)
-
-        # Four / Full house / Trips / Pairs
-        c1_rank, c1_cnt = counts_sorted[0]
-        c2_rank, c2_cnt = counts_sorted[1] if len(counts_sorted) > 1 else (0, 0)
-
-        if c1_cnt == 4:
-            kicker = max(r for r in ranks if r != c1_rank)
-            return (7, c1_rank, kicker)
-
-        if c1_cnt == 3 and c2_cnt == 2:
-            return (6, c1_rank, c2_rank)
-
-        if is_flush:
-            # Flush breaks ties by all five ranks
-            return (5, tuple(sorted(ranks, reverse=True)))
-
-        if is_straight:
-            return (4, straight_high)
-
-        if c1_cnt == 3:
-            kickers = sorted([r for r in ranks if r != c1_rank], reverse=True)
-            return (3, c1_rank, tuple(kickers))
-
-        if c1_cnt == 2 and c2_cnt == 2:
-            high_pair = max(c1_rank, c2_rank)
-            low_pair = min(c1_rank, c2_rank)
-            kicker = max(r for r in ranks if r != high_pair and r != low_pair)
-            return (2, high_pair, low_pair, kicker)
-
-        if c1_cnt == 2:
-            pair_rank = c1_rank
-            kickers = sorted([r for r in ranks if r != pair_rank], reverse=True)
-            return (1, pair_rank, tuple(kickers))
-
-        return (0, tuple(sorted(ranks, reverse=True)))
-
+        suit = 0xF000
+        rank_mask = 0
+        product = 1
+        for c in cards5:
+            suit &= c
+            rank_mask |= c
+            product *= c & 0x3F
+
+        if suit:
+            return FLUSH_SCORES[rank_mask >> 16]
+        return RANK_SCORES[product]
 
 if __name__ == '__main__':
     run_bot(Player(), parse_args())